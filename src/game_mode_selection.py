@@ -14,14 +14,14 @@ import pygame
 import tkinter as tk
 import tkinter.messagebox as messagebox
 
-from q_utils import get_colors_from_file, extract_color_palette
+from q_utils import get_stage_colors, init_mixer
 
 sys.path.append('..')
 from run import PROJECT_ROOT, get_resource_path
 
 # Get color palette
 color_file_path = get_resource_path('config/color_palette.json')
-palette = extract_color_palette(get_colors_from_file(color_file_path), 'game_mode_selection')
+palette = get_stage_colors(color_file_path, 'game_mode_selection')
 
 
 class GameModeSelection:
@@ -55,7 +55,7 @@ class GameModeSelection:
 
         # Initialize sound system
         try:
-            pygame.mixer.init()
+            init_mixer()
             self.sound_enabled = True
         except:
             self.sound_enabled = False
@@ -294,8 +294,7 @@ class GameModeSelection:
         if self.sound_enabled:
             try:
                 import pygame
-                if not pygame.mixer.get_init():
-                    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+                init_mixer()
 
                 click_sound = pygame.mixer.Sound(str(get_resource_path('resources/sounds/click.wav')))
                 click_sound.play()
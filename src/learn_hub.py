@@ -5,18 +5,21 @@ Educational resources and quantum computing concepts hub.
 """
 
 import sys
-import webbrowser
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
 import os
+from types import SimpleNamespace
 
 # Add parent directory to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from run import PROJECT_ROOT, get_resource_path
-from q_utils import get_colors_from_file, extract_color_palette
+from q_utils import get_stage_colors
 
 color_file_path = get_resource_path('config/color_palette.json')
-palette = extract_color_palette(get_colors_from_file(color_file_path), 'learn_hub')
+palette = SimpleNamespace(**get_stage_colors(color_file_path, 'learn_hub'))
+
+# Shared font for canvas dialog buttons
+DIALOG_BUTTON_FONT = ('Arial', 12, 'bold')
 
 
 class LearnHub:
@@ -31,7 +34,7 @@ class LearnHub:
         # Enable fullscreen
         self.root.overrideredirect(True)
         self.root.geometry(f"{screen_width}x{screen_height}")
-        self.root.configure(bg=palette['background_2'])
+        self.root.configure(bg=palette.background_2)
         self.root.resizable(False, False)  # Fixed size window
 
         # Store dimensions for relative sizing (use full screen)
@@ -85,23 +88,23 @@ class LearnHub:
         for scrollbar_style in ["TScrollbar", "Vertical.TScrollbar"]:
             style.configure(scrollbar_style, 
                           gripcount=0,
-                          background=palette['subtitle_color'],
-                          darkcolor=palette['background_4'], 
-                          lightcolor=palette['background_3'],
-                          troughcolor=palette['background_4'],
-                          bordercolor=palette['background_4'],
-                          arrowcolor=palette['title_color'],
+                          background=palette.subtitle_color,
+                          darkcolor=palette.background_4, 
+                          lightcolor=palette.background_3,
+                          troughcolor=palette.background_4,
+                          bordercolor=palette.background_4,
+                          arrowcolor=palette.title_color,
                           arrowsize=40,
                           width=150)  # Extra wide scrollbar for tablet use
         
         # Apply the styling to map states as well
         style.map("TScrollbar",
-                background=[("active", palette['background_4'])],
-                arrowcolor=[("active", palette['title_color'])])
+                background=[("active", palette.background_4)],
+                arrowcolor=[("active", palette.title_color)])
         
         style.map("Vertical.TScrollbar",
-                background=[("active", palette['background_4'])],
-                arrowcolor=[("active", palette['title_color'])])
+                background=[("active", palette.background_4)],
+                arrowcolor=[("active", palette.title_color)])
         
         # Override any default scrollbar appearance
         self.root.option_add("*TScrollbar*width", 150)
@@ -128,7 +131,12 @@ class LearnHub:
         rect_id = btn_canvas.create_rectangle(2, 2, width-2, height-2,
                                             fill=bg_color, outline=bg_color, width=0)
         text_id = btn_canvas.create_text(width//2, height//2, text=text,
-                                       font=('Arial', 12, 'bold'), fill=fg_color)
+                                       font=DIALOG_BUTTON_FONT, fill=fg_color)
+
+        # Resolve hover colors once instead of on every enter event
+        hover_bg = palette.button_hover_background
+        hover_fg = palette.button_hover_text_color
+        itemconfig = btn_canvas.itemconfig
 
         # Add click handler
         def on_click(event):
@@ -136,12 +144,12 @@ class LearnHub:
 
         # Add hover effects
         def on_enter(event):
-            btn_canvas.itemconfig(rect_id, fill=palette['button_hover_background'])
-            btn_canvas.itemconfig(text_id, fill=palette['button_hover_text_color'])
+            itemconfig(rect_id, fill=hover_bg)
+            itemconfig(text_id, fill=hover_fg)
 
         def on_leave(event):
-            btn_canvas.itemconfig(rect_id, fill=bg_color)
-            btn_canvas.itemconfig(text_id, fill=fg_color)
+            itemconfig(rect_id, fill=bg_color)
+            itemconfig(text_id, fill=fg_color)
 
         btn_canvas.bind("<Button-1>", on_click)
         btn_canvas.bind("<Enter>", on_enter)
@@ -202,22 +210,22 @@ class LearnHub:
     def create_learn_hub_ui(self):
         """Create the enhanced learn hub interface"""
         # Main container with gradient-like effect
-        main_frame = tk.Frame(self.root, bg=palette['background_2'])
+        main_frame = tk.Frame(self.root, bg=palette.background_2)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Add subtle top border with relative height
-        top_border = tk.Frame(main_frame, bg=palette['top_border_color'], height=int(self.screen_height * 0.003))
+        top_border = tk.Frame(main_frame, bg=palette.top_border_color, height=int(self.screen_height * 0.003))
         top_border.pack(fill=tk.X)
 
         # Content frame - using relative padding
-        content_frame = tk.Frame(main_frame, bg=palette['background_3'])
+        content_frame = tk.Frame(main_frame, bg=palette.background_3)
         content_frame.pack(fill=tk.BOTH, expand=True)
 
         # Create simplified header with internal padding
         self.create_animated_header(content_frame)
 
         # Create a container for the notebook spanning full width
-        notebook_container = tk.Frame(content_frame, bg=palette['background_3'])
+        notebook_container = tk.Frame(content_frame, bg=palette.background_3)
         notebook_container.pack(fill=tk.BOTH, expand=True,
                             padx=0,  # No horizontal padding for full width
                             pady=(0, int(self.screen_height * 0.02)))
@@ -250,8 +258,8 @@ class LearnHub:
             content_frame, 
             text="↓ Drag to scroll content ↓",
             font=('Arial', 16, 'italic'),
-            fg=palette['subtitle_color'],
-            bg=palette['background_3']
+            fg=palette.subtitle_color,
+            bg=palette.background_3
         )
         self.scroll_indicator.place(relx=0.5, rely=0.95, anchor="center")
         
@@ -294,6 +302,10 @@ class LearnHub:
         current_tab = self.notebook.index("current")
         tab_name = self.notebook.tab(current_tab, "text").strip()
         
+        # Materialize the resource cards only once they are actually visible
+        if tab_name == "Resources":
+            self._populate_resources_tab()
+
         # If this tab has scroll widgets, bind them
         if tab_name in self.tab_scrolling:
             canvas = self.tab_scrolling[tab_name]
@@ -376,17 +388,17 @@ class LearnHub:
         community_frame = ttk.Frame(self.notebook)
         self.notebook.add(community_frame, text="Community")
 
-        main_container = tk.Frame(community_frame, bg=palette['background_3'])
+        main_container = tk.Frame(community_frame, bg=palette.background_3)
         main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
 
         # Centered title
-        title_frame = tk.Frame(main_container, bg=palette['background_3'])
+        title_frame = tk.Frame(main_container, bg=palette.background_3)
         title_frame.pack(fill=tk.X, pady=10)
         tk.Label(title_frame, text="Quantum Computing Communities", font=('Arial', 36, 'bold'), 
-                 fg=palette['title_color'], bg=palette['background_3']).pack(pady=10, anchor="center")
+                 fg=palette.title_color, bg=palette.background_3).pack(pady=10, anchor="center")
         
         # Create a frame with scrollbar for better tablet usability
-        outer_frame = tk.Frame(main_container, bg=palette['background_3'])
+        outer_frame = tk.Frame(main_container, bg=palette.background_3)
         outer_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create a large scrollbar for tablet use
@@ -394,7 +406,7 @@ class LearnHub:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5, padx=(5, 0))
         
         # Create canvas with scrollbar
-        canvas = tk.Canvas(outer_frame, bg=palette['background_3'], 
+        canvas = tk.Canvas(outer_frame, bg=palette.background_3, 
                          highlightthickness=0,
                          yscrollcommand=scrollbar.set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -403,7 +415,7 @@ class LearnHub:
         scrollbar.config(command=canvas.yview)
         
         # Create frame inside canvas to hold content
-        content_frame = tk.Frame(canvas, bg=palette['background_3'])
+        content_frame = tk.Frame(canvas, bg=palette.background_3)
         
         # Create window in canvas to display the content frame
         canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw", tags="content_frame")
@@ -459,26 +471,26 @@ class LearnHub:
         # Create community cards directly in the content frame
         for i, community in enumerate(communities):
             # Create card with visible border
-            card = tk.Frame(content_frame, bg=palette['background_3'], bd=2, relief=tk.RAISED,
+            card = tk.Frame(content_frame, bg=palette.background_3, bd=2, relief=tk.RAISED,
                           highlightbackground="#4ecdc4", highlightthickness=2)
             card.pack(fill=tk.X, pady=15, padx=20)
             
             # Card title
             tk.Label(card, text=community["name"], font=('Arial', 32, 'bold'), 
-                    fg="#00ff88", bg=palette['background_3']).pack(anchor="center", pady=10)
+                    fg="#00ff88", bg=palette.background_3).pack(anchor="center", pady=10)
             
             # Card description
             tk.Label(card, text=community["description"], font=('Arial', 22), 
-                    fg=palette['subtitle_color'], bg=palette['background_3'], 
+                    fg=palette.subtitle_color, bg=palette.background_3, 
                     wraplength=900, justify=tk.CENTER).pack(anchor="center", pady=5)
             
             # Members info
             tk.Label(card, text=f"Members: {community['members']}", font=('Arial', 20), 
-                    fg=palette['description_label_color'], bg=palette['background_3']).pack(anchor="center", pady=5)
+                    fg=palette.description_label_color, bg=palette.background_3).pack(anchor="center", pady=5)
             
             # Topics info
             tk.Label(card, text=f"Topics: {community['topics']}", font=('Arial', 20), 
-                    fg=palette['description_label_color'], bg=palette['background_3'],
+                    fg=palette.description_label_color, bg=palette.background_3,
                     wraplength=900, justify=tk.CENTER).pack(anchor="center", pady=5)
             
             # Add separator except for last item
@@ -490,17 +502,17 @@ class LearnHub:
         news_frame = ttk.Frame(self.notebook)
         self.notebook.add(news_frame, text="News & Research")
 
-        main_container = tk.Frame(news_frame, bg=palette['background_3'])
+        main_container = tk.Frame(news_frame, bg=palette.background_3)
         main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
 
         # Centered title
-        title_frame = tk.Frame(main_container, bg=palette['background_3'])
+        title_frame = tk.Frame(main_container, bg=palette.background_3)
         title_frame.pack(fill=tk.X, pady=10)
         tk.Label(title_frame, text="Latest Quantum Computing News", font=('Arial', 36, 'bold'), 
-                 fg=palette['title_color'], bg=palette['background_3']).pack(pady=10, anchor="center")
+                 fg=palette.title_color, bg=palette.background_3).pack(pady=10, anchor="center")
         
         # Create a frame with scrollbar for better tablet usability
-        outer_frame = tk.Frame(main_container, bg=palette['background_3'])
+        outer_frame = tk.Frame(main_container, bg=palette.background_3)
         outer_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create a large scrollbar for tablet use
@@ -511,7 +523,7 @@ class LearnHub:
         scrollbar.configure(style="Vertical.TScrollbar")
         
         # Create canvas with scrollbar
-        canvas = tk.Canvas(outer_frame, bg=palette['background_3'], 
+        canvas = tk.Canvas(outer_frame, bg=palette.background_3, 
                          highlightthickness=0,
                          yscrollcommand=scrollbar.set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -520,7 +532,7 @@ class LearnHub:
         scrollbar.config(command=canvas.yview)
         
         # Create frame inside canvas to hold content
-        content_frame = tk.Frame(canvas, bg=palette['background_3'])
+        content_frame = tk.Frame(canvas, bg=palette.background_3)
         
         # Create window in canvas to display the content frame
         canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw", tags="content_frame")
@@ -578,37 +590,37 @@ class LearnHub:
         ]
         
         # Container to center all news cards
-        news_container = tk.Frame(content_frame, bg=palette['background_3'])
+        news_container = tk.Frame(content_frame, bg=palette.background_3)
         news_container.pack(fill=tk.X, expand=True)
         
         for i, article in enumerate(news):
             # Frame to center the card
-            article_container = tk.Frame(news_container, bg=palette['background_3'])
+            article_container = tk.Frame(news_container, bg=palette.background_3)
             article_container.pack(fill=tk.X, expand=True, pady=15, padx=10)
             
             # The news card with increased padding for touch friendliness
-            frame = tk.Frame(article_container, bg=palette['background_3'], bd=2, relief=tk.RAISED)
+            frame = tk.Frame(article_container, bg=palette.background_3, bd=2, relief=tk.RAISED)
             frame.pack(fill=tk.X, expand=True)
             
             # Header section with title and date - centered
-            header = tk.Frame(frame, bg=palette['background_3'], padx=15, pady=15)
+            header = tk.Frame(frame, bg=palette.background_3, padx=15, pady=15)
             header.pack(fill=tk.X)
             
             # Title centered
             tk.Label(header, text=article["title"], font=('Arial', 28, 'bold'), 
-                    fg="#4ecdc4", bg=palette['background_3'], 
+                    fg="#4ecdc4", bg=palette.background_3, 
                     wraplength=900, justify=tk.CENTER).pack(anchor="center", pady=5)
             
             # Date centered
             tk.Label(header, text=article["date"], font=('Arial', 20, 'italic'), 
-                    fg=palette['description_label_color'], bg=palette['background_3']).pack(anchor="center")
+                    fg=palette.description_label_color, bg=palette.background_3).pack(anchor="center")
             
             # Source and category in separate sections with larger touch targets
-            category_frame = tk.Frame(frame, bg=palette['background_3'], padx=15, pady=10)
+            category_frame = tk.Frame(frame, bg=palette.background_3, padx=15, pady=10)
             category_frame.pack(fill=tk.X)
             
             # Center-align the content
-            category_inner = tk.Frame(category_frame, bg=palette['background_3'])
+            category_inner = tk.Frame(category_frame, bg=palette.background_3)
             category_inner.pack(anchor="center")
             
             # Category tag - larger and more prominent
@@ -618,22 +630,22 @@ class LearnHub:
             
             # Source
             tk.Label(category_inner, text=f"Source: {article['source']}", font=('Arial', 20), 
-                    fg=palette['description_label_color'], bg=palette['background_3'], padx=8, pady=8).pack(side=tk.LEFT)
+                    fg=palette.description_label_color, bg=palette.background_3, padx=8, pady=8).pack(side=tk.LEFT)
             
             # Summary - centered text
-            summary_frame = tk.Frame(frame, bg=palette['background_3'], padx=20, pady=15)
+            summary_frame = tk.Frame(frame, bg=palette.background_3, padx=20, pady=15)
             summary_frame.pack(fill=tk.X)
             
             tk.Label(summary_frame, text=article["summary"], font=('Arial', 22), 
-                    fg=palette['subtitle_color'], bg=palette['background_3'], 
+                    fg=palette.subtitle_color, bg=palette.background_3, 
                     wraplength=900, justify=tk.CENTER).pack(anchor="center")
             
             # Bottom padding for better touch
-            tk.Frame(frame, height=10, bg=palette['background_3']).pack(fill=tk.X)
+            tk.Frame(frame, height=10, bg=palette.background_3).pack(fill=tk.X)
             
             # Separator except for last item
             if i < len(news) - 1:
-                sep_frame = tk.Frame(news_container, bg=palette['background_3'])
+                sep_frame = tk.Frame(news_container, bg=palette.background_3)
                 sep_frame.pack(fill=tk.X, expand=True)
                 ttk.Separator(sep_frame, orient='horizontal').pack(fill=tk.X, padx=50, pady=10)
 
@@ -642,17 +654,17 @@ class LearnHub:
         projects_frame = ttk.Frame(self.notebook)
         self.notebook.add(projects_frame, text="Projects")
 
-        main_container = tk.Frame(projects_frame, bg=palette['background_3'])
+        main_container = tk.Frame(projects_frame, bg=palette.background_3)
         main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
 
         # Centered title
-        title_frame = tk.Frame(main_container, bg=palette['background_3'])
+        title_frame = tk.Frame(main_container, bg=palette.background_3)
         title_frame.pack(fill=tk.X, pady=10)
         tk.Label(title_frame, text="Quantum Computing Projects & Challenges", font=('Arial', 36, 'bold'), 
-                 fg=palette['title_color'], bg=palette['background_3']).pack(pady=10, anchor="center")
+                 fg=palette.title_color, bg=palette.background_3).pack(pady=10, anchor="center")
         
         # Create a frame with scrollbar for better tablet usability
-        outer_frame = tk.Frame(main_container, bg=palette['background_3'])
+        outer_frame = tk.Frame(main_container, bg=palette.background_3)
         outer_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create a large scrollbar for tablet use
@@ -663,7 +675,7 @@ class LearnHub:
         scrollbar.configure(style="Vertical.TScrollbar")
         
         # Create canvas with scrollbar
-        canvas = tk.Canvas(outer_frame, bg=palette['background_3'], 
+        canvas = tk.Canvas(outer_frame, bg=palette.background_3, 
                          highlightthickness=0,
                          yscrollcommand=scrollbar.set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -672,7 +684,7 @@ class LearnHub:
         scrollbar.config(command=canvas.yview)
         
         # Create frame inside canvas to hold content
-        content_frame = tk.Frame(canvas, bg=palette['background_3'])
+        content_frame = tk.Frame(canvas, bg=palette.background_3)
         
         # Create window in canvas to display the content frame
         canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw", tags="content_frame")
@@ -760,7 +772,7 @@ class LearnHub:
         ]
         
         # Container to center all project cards
-        projects_container = tk.Frame(content_frame, bg=palette['background_3'])
+        projects_container = tk.Frame(content_frame, bg=palette.background_3)
         projects_container.pack(fill=tk.X, expand=True)
         
         for i, project in enumerate(projects):
@@ -775,24 +787,24 @@ class LearnHub:
             border_color = difficulty_colors.get(project["difficulty"], "#CCCCCC")
             
             # Frame to center each project card
-            card_container = tk.Frame(projects_container, bg=palette['background_3'])
+            card_container = tk.Frame(projects_container, bg=palette.background_3)
             card_container.pack(fill=tk.X, expand=True, pady=20, padx=20)
             
             # Project card with larger touch targets
-            card = tk.Frame(card_container, bg=palette['background_3'], bd=3, 
+            card = tk.Frame(card_container, bg=palette.background_3, bd=3, 
                            highlightbackground=border_color, highlightthickness=3)
             card.pack(fill=tk.X, expand=True)
             
             # Header with title and difficulty badge - centered
-            header = tk.Frame(card, bg=palette['background_3'], padx=20, pady=15)
+            header = tk.Frame(card, bg=palette.background_3, padx=20, pady=15)
             header.pack(fill=tk.X)
             
             # Title centered
             tk.Label(header, text=project["title"], font=('Arial', 28, 'bold'), 
-                    fg=palette['enhanced_title_color'], bg=palette['background_3']).pack(anchor="center", pady=5)
+                    fg=palette.enhanced_title_color, bg=palette.background_3).pack(anchor="center", pady=5)
             
             # Difficulty and time info - centered
-            info_frame = tk.Frame(header, bg=palette['background_3'])
+            info_frame = tk.Frame(header, bg=palette.background_3)
             info_frame.pack(anchor="center", pady=5)
             
             # Difficulty badge - larger for touch
@@ -805,78 +817,78 @@ class LearnHub:
             # Time estimate - larger for touch
             tk.Label(info_frame, text=f"Time: {project['time']}", 
                     font=('Arial', 18), 
-                    fg=palette['description_label_color'], 
-                    bg=palette['background_3'],
+                    fg=palette.description_label_color, 
+                    bg=palette.background_3,
                     padx=8, pady=8).pack(side=tk.LEFT)
             
             # Description - centered
-            desc_frame = tk.Frame(card, bg=palette['background_3'], padx=20, pady=10)
+            desc_frame = tk.Frame(card, bg=palette.background_3, padx=20, pady=10)
             desc_frame.pack(fill=tk.X)
             
             tk.Label(desc_frame, text=project["description"], 
                     font=('Arial', 20), 
-                    fg=palette['subtitle_color'], bg=palette['background_3'], 
+                    fg=palette.subtitle_color, bg=palette.background_3, 
                     wraplength=900, justify=tk.CENTER).pack(anchor="center")
             
             # Tools section - centered
-            tools_frame = tk.Frame(card, bg=palette['background_3'], padx=20, pady=10)
+            tools_frame = tk.Frame(card, bg=palette.background_3, padx=20, pady=10)
             tools_frame.pack(fill=tk.X)
             
-            tools_container = tk.Frame(tools_frame, bg=palette['background_3'])
+            tools_container = tk.Frame(tools_frame, bg=palette.background_3)
             tools_container.pack(anchor="center")
             
             tk.Label(tools_container, text="Tools:", 
                     font=('Arial', 20, 'bold'), 
-                    fg=palette['subtitle_color'], bg=palette['background_3']).pack(side=tk.LEFT, padx=(0, 8))
+                    fg=palette.subtitle_color, bg=palette.background_3).pack(side=tk.LEFT, padx=(0, 8))
             
             tk.Label(tools_container, text=project["tools"], 
                     font=('Arial', 20), 
-                    fg=palette['description_label_color'], bg=palette['background_3']).pack(side=tk.LEFT)
+                    fg=palette.description_label_color, bg=palette.background_3).pack(side=tk.LEFT)
             
             # Steps section - centered header with left-aligned steps for readability
-            steps_frame = tk.Frame(card, bg=palette['background_3'], padx=20, pady=10)
+            steps_frame = tk.Frame(card, bg=palette.background_3, padx=20, pady=10)
             steps_frame.pack(fill=tk.X)
             
             tk.Label(steps_frame, text="Implementation Steps:", 
                     font=('Arial', 20, 'bold'), 
-                    fg=palette['subtitle_color'], bg=palette['background_3']).pack(anchor="center", pady=5)
+                    fg=palette.subtitle_color, bg=palette.background_3).pack(anchor="center", pady=5)
             
             # Create bulleted list of steps - centered frame with left-aligned text
-            steps_list = tk.Frame(steps_frame, bg=palette['background_3'])
+            steps_list = tk.Frame(steps_frame, bg=palette.background_3)
             steps_list.pack(anchor="center", pady=5)
             
             for j, step in enumerate(project["steps"]):
-                step_frame = tk.Frame(steps_list, bg=palette['background_3'])
+                step_frame = tk.Frame(steps_list, bg=palette.background_3)
                 step_frame.pack(fill=tk.X, anchor="w", pady=4)  # Increased padding for touch
                 
                 tk.Label(step_frame, text="•", 
                         font=('Arial', 20), 
-                        fg=palette['subtitle_color'], bg=palette['background_3']).pack(side=tk.LEFT, padx=(0, 12))
+                        fg=palette.subtitle_color, bg=palette.background_3).pack(side=tk.LEFT, padx=(0, 12))
                 
                 tk.Label(step_frame, text=step, 
                         font=('Arial', 20), 
-                        fg=palette['subtitle_color'], bg=palette['background_3'], 
+                        fg=palette.subtitle_color, bg=palette.background_3, 
                         anchor="w").pack(side=tk.LEFT, fill=tk.X)
                         
             # Add bottom padding for touch
-            tk.Frame(card, height=15, bg=palette['background_3']).pack(fill=tk.X)
+            tk.Frame(card, height=15, bg=palette.background_3).pack(fill=tk.X)
 
     def create_career_tab(self):
         """Career & Learning Pathways tab: integrated information instead of external links"""
         career_frame = ttk.Frame(self.notebook)
         self.notebook.add(career_frame, text="Careers")
 
-        main_container = tk.Frame(career_frame, bg=palette['background_3'])
+        main_container = tk.Frame(career_frame, bg=palette.background_3)
         main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
 
         # Centered title
-        title_frame = tk.Frame(main_container, bg=palette['background_3'])
+        title_frame = tk.Frame(main_container, bg=palette.background_3)
         title_frame.pack(fill=tk.X, pady=10)
         tk.Label(title_frame, text="Quantum Computing Career Paths", font=('Arial', 36, 'bold'), 
-                fg=palette['title_color'], bg=palette['background_3']).pack(pady=10, anchor="center")
+                fg=palette.title_color, bg=palette.background_3).pack(pady=10, anchor="center")
         
         # Create a frame with scrollbar for better tablet usability
-        outer_frame = tk.Frame(main_container, bg=palette['background_3'])
+        outer_frame = tk.Frame(main_container, bg=palette.background_3)
         outer_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create a large scrollbar for tablet use
@@ -887,7 +899,7 @@ class LearnHub:
         scrollbar.configure(style="Vertical.TScrollbar")
         
         # Create canvas with scrollbar
-        canvas = tk.Canvas(outer_frame, bg=palette['background_3'], 
+        canvas = tk.Canvas(outer_frame, bg=palette.background_3, 
                          highlightthickness=0,
                          yscrollcommand=scrollbar.set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -896,7 +908,7 @@ class LearnHub:
         scrollbar.config(command=canvas.yview)
         
         # Create frame inside canvas to hold content
-        content_frame = tk.Frame(canvas, bg=palette['background_3'])
+        content_frame = tk.Frame(canvas, bg=palette.background_3)
         
         # Create window in canvas to display the content frame
         canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw", tags="content_frame")
@@ -973,21 +985,21 @@ class LearnHub:
         # Create career cards directly in the content frame
         for i, career in enumerate(careers):
             # Create card with visible border
-            card = tk.Frame(content_frame, bg=palette['background_3'], bd=2, relief=tk.RAISED)
+            card = tk.Frame(content_frame, bg=palette.background_3, bd=2, relief=tk.RAISED)
             card.pack(fill=tk.X, pady=15, padx=20)
             
             # Title with underline - centered
-            title_frame = tk.Frame(card, bg=palette['background_3'], padx=15, pady=15)
+            title_frame = tk.Frame(card, bg=palette.background_3, padx=15, pady=15)
             title_frame.pack(fill=tk.X)
             
             tk.Label(title_frame, text=career["title"], font=('Arial', 28, 'bold'), 
-                    fg="#ffb86b", bg=palette['background_3']).pack(anchor="center")
+                    fg="#ffb86b", bg=palette.background_3).pack(anchor="center")
             
             separator = ttk.Separator(card, orient='horizontal')
             separator.pack(fill=tk.X, padx=20, pady=5)
             
             # Content frame - centered layout
-            content = tk.Frame(card, bg=palette['background_3'], padx=20, pady=10)
+            content = tk.Frame(card, bg=palette.background_3, padx=20, pady=10)
             content.pack(fill=tk.X)
             
             # Information sections centered but with content left-aligned for readability
@@ -1001,35 +1013,35 @@ class LearnHub:
             ]
             
             for section in sections:
-                section_frame = tk.Frame(content, bg=palette['background_3'], pady=10)
+                section_frame = tk.Frame(content, bg=palette.background_3, pady=10)
                 section_frame.pack(fill=tk.X, anchor="center")
                 
                 # Section title
                 title_label = tk.Label(section_frame, text=section["title"], font=('Arial', 20, 'bold'), 
-                        fg=palette['subtitle_color'], bg=palette['background_3'])
+                        fg=palette.subtitle_color, bg=palette.background_3)
                 title_label.pack(anchor="center", pady=(0, 6))
                 
                 # Content - larger font for better readability on touch screens
                 content_label = tk.Label(section_frame, text=section["content"], font=('Arial', 18), 
-                        fg=palette['description_label_color'], bg=palette['background_3'], 
+                        fg=palette.description_label_color, bg=palette.background_3, 
                         wraplength=900, justify=tk.CENTER)
                 content_label.pack(anchor="center")
             
             # Add bottom padding for touch
-            tk.Frame(card, height=10, bg=palette['background_3']).pack(fill=tk.X)
+            tk.Frame(card, height=10, bg=palette.background_3).pack(fill=tk.X)
             
             # Add separator except for last item
             if i < len(careers) - 1:
                 ttk.Separator(content_frame, orient='horizontal').pack(fill=tk.X, padx=50, pady=10)
     def create_animated_header(self, parent):
         """Create a simplified header without animation canvas"""
-        header_frame = tk.Frame(parent, bg=palette['background_3'])
+        header_frame = tk.Frame(parent, bg=palette.background_3)
         header_frame.pack(fill=tk.X,
                         padx=int(self.screen_width * 0.02),
                         pady=(int(self.screen_height * 0.02), int(self.screen_height * 0.015)))
 
         # Add a top navigation bar
-        nav_frame = tk.Frame(header_frame, bg=palette['background_3'])
+        nav_frame = tk.Frame(header_frame, bg=palette.background_3)
         nav_frame.pack(fill=tk.X, pady=(0, int(self.screen_height * 0.008)))
 
         # Back to Main Screen button - top right with relative sizing
@@ -1041,7 +1053,7 @@ class LearnHub:
         back_main_canvas = tk.Canvas(nav_frame,
                                width=button_width,
                                height=button_height,
-                               bg=palette['learn_hub_button_color'],
+                               bg=palette.learn_hub_button_color,
                                highlightthickness=0,
                                bd=0)
 
@@ -1049,7 +1061,7 @@ class LearnHub:
 
         # Draw button background with proper colors - larger for touch
         back_main_canvas.create_rectangle(2, 2, button_width-2, button_height-2,
-                                        fill=palette['learn_hub_button_color'],
+                                        fill=palette.learn_hub_button_color,
                                         outline="#2b3340", width=2,
                                         tags="menu_bg")
 
@@ -1057,7 +1069,7 @@ class LearnHub:
         back_main_canvas.create_text(button_width//2, button_height//2,
                                 text=" Main Screen",
                                 font=('Arial', button_font_size, 'bold'),
-                                fill=palette['learn_hub_button_text_color'],
+                                fill=palette.learn_hub_button_text_color,
                                 tags="menu_text")
 
         # Bind click events
@@ -1066,13 +1078,13 @@ class LearnHub:
 
         # FIXED: Hover effects with proper colors
         def on_menu_enter(event):
-            back_main_canvas.itemconfig("menu_bg", fill=palette['learn_hub_button_hover_color'])  # FIXED: Use hover color
-            back_main_canvas.itemconfig("menu_text", fill=palette['learn_hub_button_text_color'])  # Keep text color consistent
+            back_main_canvas.itemconfig("menu_bg", fill=palette.learn_hub_button_hover_color)  # FIXED: Use hover color
+            back_main_canvas.itemconfig("menu_text", fill=palette.learn_hub_button_text_color)  # Keep text color consistent
             back_main_canvas.configure(cursor="hand2")
 
         def on_menu_leave(event):
-            back_main_canvas.itemconfig("menu_bg", fill=palette['learn_hub_button_color'])  # FIXED: Back to normal color
-            back_main_canvas.itemconfig("menu_text", fill=palette['learn_hub_button_text_color'])  # Keep text color consistent
+            back_main_canvas.itemconfig("menu_bg", fill=palette.learn_hub_button_color)  # FIXED: Back to normal color
+            back_main_canvas.itemconfig("menu_text", fill=palette.learn_hub_button_text_color)  # Keep text color consistent
             back_main_canvas.configure(cursor="")
 
         back_main_canvas.bind("<Button-1>", on_menu_click)
@@ -1080,20 +1092,20 @@ class LearnHub:
         back_main_canvas.bind("<Leave>", on_menu_leave)
 
         # Title with shadow effect and relative font size
-        title_frame = tk.Frame(header_frame, bg=palette['background_3'])
+        title_frame = tk.Frame(header_frame, bg=palette.background_3)
         title_frame.pack()
 
         # Shadow title with relative font size
         title_font_size = max(24, int(self.screen_width * 0.025))
         shadow_title = tk.Label(title_frame, text=" Quantum Computing Learn Hub",
                             font=('Arial', title_font_size, 'bold'),
-                            fg='#003322', bg=palette['background_3'])
+                            fg='#003322', bg=palette.background_3)
         shadow_title.place(x=3, y=3)
 
         # Main title with gradient-like effect
         main_title = tk.Label(title_frame, text=" Quantum Computing Learn Hub",
                             font=('Arial', title_font_size, 'bold'),
-                            fg=palette['title_color'], bg=palette['background_3'])
+                            fg=palette.title_color, bg=palette.background_3)
         main_title.pack(pady=(0, int(self.screen_height * 0.008)))
 
         # Enhanced subtitle with pulsing effect and relative font size
@@ -1101,7 +1113,7 @@ class LearnHub:
         self.subtitle_label = tk.Label(header_frame,
                                     text=" Explore quantum computing concepts and resources ",
                                     font=('Arial', subtitle_font_size, 'italic'),
-                                    fg=palette['subtitle_color'], bg=palette['background_3'])
+                                    fg=palette.subtitle_color, bg=palette.background_3)
         self.subtitle_label.pack()
 
 
@@ -1125,7 +1137,7 @@ class LearnHub:
                 height = 120   # fallback height
 
             # Draw quantum wires with glow effect
-            wire_colors = [palette['quantum_wire_1'], palette['quantum_wire_2'], palette['quantum_wire_3']]
+            wire_colors = [palette.quantum_wire_1, palette.quantum_wire_2, palette.quantum_wire_3]
             wire_spacing = height // 4  # Adaptive spacing based on canvas height
 
             for i in range(3):
@@ -1140,10 +1152,10 @@ class LearnHub:
             # Draw quantum gates with enhanced styling - adaptive positioning
             gate_spacing = (width - 200) // 4  # Adaptive gate spacing
             gate_info = [
-                {'symbol': 'H', 'color': palette['H_color'], 'x': 100 + gate_spacing},
-                {'symbol': 'X', 'color': palette['X_color'], 'x': 100 + 2 * gate_spacing},
-                {'symbol': 'Z', 'color': palette['Z_color'], 'x': 100 + 3 * gate_spacing},
-                {'symbol': 'CNOT', 'color': palette['CNOT_color'], 'x': 100 + 4 * gate_spacing, 'double': True}
+                {'symbol': 'H', 'color': palette.H_color, 'x': 100 + gate_spacing},
+                {'symbol': 'X', 'color': palette.X_color, 'x': 100 + 2 * gate_spacing},
+                {'symbol': 'Z', 'color': palette.Z_color, 'x': 100 + 3 * gate_spacing},
+                {'symbol': 'CNOT', 'color': palette.CNOT_color, 'x': 100 + 4 * gate_spacing, 'double': True}
             ]
 
             for gate in gate_info:
@@ -1186,7 +1198,7 @@ class LearnHub:
 
                 # 3D shadow effect
                 self.circuit_canvas.create_rectangle(x-17, y-12, x+17, y+12,
-                                                fill=palette['background_black'], outline='')
+                                                fill=palette.background_black, outline='')
                 # Main gate
                 self.circuit_canvas.create_rectangle(x-15, y-10, x+15, y+10,
                                                 fill=color, outline='white', width=2)
@@ -1208,13 +1220,13 @@ class LearnHub:
 
         # Enhanced notebook styling with larger targets for touch screens - full width
         style.configure('TNotebook',
-                    background=palette['background_3'],
+                    background=palette.background_3,
                     borderwidth=0,
                     tabmargins=[0, 0, 0, 0])  # Remove margins to span full width
 
         # Larger padding for touch-friendly tabs - equal distribution
         style.configure('TNotebook.Tab',
-                    background=palette['background_4'],
+                    background=palette.background_4,
                     foreground='#ffffff',  # Default text color - white
                     padding=[10, 20],      # Reduced horizontal padding to fit equally
                     borderwidth=0,
@@ -1223,8 +1235,8 @@ class LearnHub:
 
         # FIXED: Text colors for tab states
         style.map('TNotebook.Tab',
-                background=[('selected', palette['background_3']),  # Selected tab background
-                            ('active', palette['background_4'])],    # Hover background
+                background=[('selected', palette.background_3),  # Selected tab background
+                            ('active', palette.background_4)],    # Hover background
                 foreground=[('selected', '#ffb86b'),               # FIXED: Orange text when selected
                             ('active', '#ffffff'),                  # White text when hovering
                             ('!active', '#ffffff')])               # White text when not active
@@ -1232,16 +1244,16 @@ class LearnHub:
         # Style large tablet-friendly scrollbars
         style.configure("Vertical.TScrollbar", 
                         gripcount=0,
-                        background=palette['subtitle_color'],
-                        darkcolor=palette['background_4'], 
-                        lightcolor=palette['background_3'],
-                        troughcolor=palette['background_4'],
-                        bordercolor=palette['background_4'],
+                        background=palette.subtitle_color,
+                        darkcolor=palette.background_4, 
+                        lightcolor=palette.background_3,
+                        troughcolor=palette.background_4,
+                        bordercolor=palette.background_4,
                         arrowcolor='#ffffff',
                         arrowsize=100,
                         width=150)  # Extra wide scrollbar for tablet use
 
-        style.configure('TFrame', background=palette['background_3'])
+        style.configure('TFrame', background=palette.background_3)
 
         # Center the tabs by configuring tab positioning
         style.configure('TNotebook', tabposition='n')
@@ -1265,7 +1277,7 @@ class LearnHub:
                     # Apply uniform width to all tabs through styling
                     style = ttk.Style()
                     style.configure('TNotebook.Tab',
-                        background=palette['background_4'],
+                        background=palette.background_4,
                         foreground='#ffffff',
                         padding=[5, 20],  # Minimal horizontal padding
                         borderwidth=0,
@@ -1289,7 +1301,7 @@ class LearnHub:
 
     def create_enhanced_gate_card_horizontal(self, parent, name, description, formula, color, icon, difficulty):
         """Create enhanced cards for quantum gates with horizontal layout and hover effects"""
-        card_frame = tk.Frame(parent, bg=palette['background_3'], relief=tk.FLAT, bd=0, width=200, height=250)  # Fixed size
+        card_frame = tk.Frame(parent, bg=palette.background_3, relief=tk.FLAT, bd=0, width=200, height=250)  # Fixed size
         card_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=8)
         card_frame.pack_propagate(False)  # Maintain fixed size
 
@@ -1299,60 +1311,60 @@ class LearnHub:
         glow_frame.pack_forget()
 
         # Main content frame
-        content_frame = tk.Frame(card_frame, bg=palette['background_3'])
+        content_frame = tk.Frame(card_frame, bg=palette.background_3)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=12)
 
         # Header with icon and title
-        header_frame = tk.Frame(content_frame, bg=palette['background_3'])
+        header_frame = tk.Frame(content_frame, bg=palette.background_3)
         header_frame.pack(fill=tk.X, pady=(0, 8))
 
         # Gate icon - centered
         icon_label = tk.Label(header_frame, text=icon,
-                            font=('Arial', 24), bg=palette['background_3'])  # Increased icon size
+                            font=('Arial', 24), bg=palette.background_3)  # Increased icon size
         icon_label.pack()
 
         # Title - centered
         name_label = tk.Label(header_frame, text=name,
                             font=('Arial', 12, 'bold'),  # Slightly smaller font
-                            fg=color, bg=palette['background_3'])
+                            fg=color, bg=palette.background_3)
         name_label.pack(pady=(5, 0))
 
         # Difficulty stars - centered
         stars = "" * difficulty + "" * (5 - difficulty)
         difficulty_label = tk.Label(header_frame, text=f"{stars}",
                                 font=('Arial', 8),  # Smaller font
-                                fg=palette['difficulty_label_color'], bg=palette['background_3'])
+                                fg=palette.difficulty_label_color, bg=palette.background_3)
         difficulty_label.pack()
 
         # Description - centered
         desc_label = tk.Label(content_frame, text=description,
                             font=('Arial', 9),  # Smaller font
-                            fg=palette['description_label_color'], bg=palette['background_3'],
+                            fg=palette.description_label_color, bg=palette.background_3,
                             wraplength=170, justify=tk.CENTER)
         desc_label.pack(pady=(0, 5))
 
         # Formula - centered
         formula_label = tk.Label(content_frame, text=formula,
                                 font=('Arial', 8, 'italic'),  # Smaller font
-                                fg=palette['formula_label_color'], bg=palette['background_3'],
+                                fg=palette.formula_label_color, bg=palette.background_3,
                                 wraplength=170, justify=tk.CENTER)
         formula_label.pack()
 
         # Hover effects
         def on_enter(event):
-            card_frame.configure(bg=palette['background_4'])
-            content_frame.configure(bg=palette['background_4'])
-            header_frame.configure(bg=palette['background_4'])
+            card_frame.configure(bg=palette.background_4)
+            content_frame.configure(bg=palette.background_4)
+            header_frame.configure(bg=palette.background_4)
             for widget in [icon_label, name_label, difficulty_label, desc_label, formula_label]:
-                widget.configure(bg=palette['background_4'])
+                widget.configure(bg=palette.background_4)
             glow_frame.pack(fill=tk.X, before=content_frame)
 
         def on_leave(event):
-            card_frame.configure(bg=palette['background_3'])
-            content_frame.configure(bg=palette['background_3'])
-            header_frame.configure(bg=palette['background_3'])
+            card_frame.configure(bg=palette.background_3)
+            content_frame.configure(bg=palette.background_3)
+            header_frame.configure(bg=palette.background_3)
             for widget in [icon_label, name_label, difficulty_label, desc_label, formula_label]:
-                widget.configure(bg=palette['background_3'])
+                widget.configure(bg=palette.background_3)
             glow_frame.pack_forget()
 
         card_frame.bind("<Enter>", on_enter)
@@ -1371,14 +1383,14 @@ class LearnHub:
         coming_frame = ttk.Frame(self.notebook)
         self.notebook.add(coming_frame, text=" Coming Soon")
 
-        main_container = tk.Frame(coming_frame, bg=palette['background_3'])
+        main_container = tk.Frame(coming_frame, bg=palette.background_3)
         main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
 
         label = tk.Label(main_container,
                         text="More quantum learning features are coming soon!\nStay tuned for interactive tutorials, quizzes, and more.",
                         font=('Arial', 16, 'italic'),
-                        fg=palette['subtitle_color'],
-                        bg=palette['background_3'],
+                        fg=palette.subtitle_color,
+                        bg=palette.background_3,
                         justify=tk.CENTER)
         label.pack(expand=True)
 
@@ -1388,17 +1400,17 @@ class LearnHub:
         resources_frame = ttk.Frame(self.notebook)
         self.notebook.add(resources_frame, text="Resources")
 
-        main_container = tk.Frame(resources_frame, bg=palette['background_3'])
+        main_container = tk.Frame(resources_frame, bg=palette.background_3)
         main_container.pack(fill=tk.BOTH, expand=True, padx=25, pady=20)
 
         # Centered title
-        title_frame = tk.Frame(main_container, bg=palette['background_3'])
+        title_frame = tk.Frame(main_container, bg=palette.background_3)
         title_frame.pack(fill=tk.X, pady=10)
         tk.Label(title_frame, text="Quantum Computing Resources", font=('Arial', 36, 'bold'), 
-                fg=palette['title_color'], bg=palette['background_3']).pack(pady=10, anchor="center")
+                fg=palette.title_color, bg=palette.background_3).pack(pady=10, anchor="center")
         
         # Create a frame with scrollbar for better tablet usability
-        outer_frame = tk.Frame(main_container, bg=palette['background_3'])
+        outer_frame = tk.Frame(main_container, bg=palette.background_3)
         outer_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create a large scrollbar for tablet use
@@ -1409,7 +1421,7 @@ class LearnHub:
         scrollbar.configure(style="Vertical.TScrollbar")
         
         # Create canvas with scrollbar
-        canvas = tk.Canvas(outer_frame, bg=palette['background_3'], 
+        canvas = tk.Canvas(outer_frame, bg=palette.background_3, 
                          highlightthickness=0,
                          yscrollcommand=scrollbar.set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -1418,7 +1430,7 @@ class LearnHub:
         scrollbar.config(command=canvas.yview)
         
         # Create frame inside canvas to hold content
-        content_frame = tk.Frame(canvas, bg=palette['background_3'])
+        content_frame = tk.Frame(canvas, bg=palette.background_3)
         
         # Create window in canvas to display the content frame
         canvas_window = canvas.create_window((0, 0), window=content_frame, anchor="nw", tags="content_frame")
@@ -1442,7 +1454,19 @@ class LearnHub:
             canvas.itemconfig(canvas_window, width=event.width)
             
         canvas.bind("<Configure>", on_canvas_resize)
-        
+
+        # Defer building the resource cards until the tab is first shown
+        self.resources_content_frame = content_frame
+        self.resources_populated = False
+
+
+    def _populate_resources_tab(self):
+        """Build the resource cards the first time the Resources tab is shown"""
+        if self.resources_populated:
+            return
+        self.resources_populated = True
+        content_frame = self.resources_content_frame
+
         # Resource categories
         categories = [
             {
@@ -1508,56 +1532,56 @@ class LearnHub:
         # Display each category and its items directly in the content frame
         for category_index, category in enumerate(categories):
             # Category header - centered
-            category_frame = tk.Frame(content_frame, bg=palette['background_3'])
+            category_frame = tk.Frame(content_frame, bg=palette.background_3)
             category_frame.pack(fill=tk.X, pady=(25, 10))
             
             tk.Label(category_frame, text=category["name"], font=('Arial', 30, 'bold'), 
-                    fg="#50fa7b", bg=palette['background_3']).pack(anchor="center", pady=8)
+                    fg="#50fa7b", bg=palette.background_3).pack(anchor="center", pady=8)
             
             # Items in this category
             for item_index, item in enumerate(category["items"]):
                 # Item card with increased padding for touch
-                item_frame = tk.Frame(content_frame, bg=palette['background_3'], bd=2, relief=tk.GROOVE)
+                item_frame = tk.Frame(content_frame, bg=palette.background_3, bd=2, relief=tk.GROOVE)
                 item_frame.pack(fill=tk.X, expand=True, padx=15, pady=10)
                 
                 # Title with authors if available - centered
-                title_frame = tk.Frame(item_frame, bg=palette['background_3'], padx=15, pady=12)
+                title_frame = tk.Frame(item_frame, bg=palette.background_3, padx=15, pady=12)
                 title_frame.pack(fill=tk.X)
                 
                 tk.Label(title_frame, text=item["title"], font=('Arial', 24, 'bold'), 
-                        fg="#8be9fd", bg=palette['background_3']).pack(anchor="center", pady=(0, 8))
+                        fg="#8be9fd", bg=palette.background_3).pack(anchor="center", pady=(0, 8))
                 
                 if "authors" in item:
                     tk.Label(title_frame, text=f"By: {item['authors']}", font=('Arial', 18, 'italic'), 
-                            fg=palette['subtitle_color'], bg=palette['background_3']).pack(anchor="center", pady=(0, 8))
+                            fg=palette.subtitle_color, bg=palette.background_3).pack(anchor="center", pady=(0, 8))
                 
                 # Description - centered text with good readability
-                desc_frame = tk.Frame(item_frame, bg=palette['background_3'], padx=24, pady=16)
+                desc_frame = tk.Frame(item_frame, bg=palette.background_3, padx=24, pady=16)
                 desc_frame.pack(fill=tk.X)
                 
                 tk.Label(desc_frame, text=item["description"], font=('Arial', 18), 
-                        fg=palette['description_label_color'], bg=palette['background_3'], 
+                        fg=palette.description_label_color, bg=palette.background_3, 
                         wraplength=900, justify=tk.CENTER).pack(anchor="center", pady=8)
             
             # Add separator between categories except for last one
             if category_index < len(categories) - 1:
-                sep_frame = tk.Frame(content_frame, bg=palette['background_3'])
+                sep_frame = tk.Frame(content_frame, bg=palette.background_3)
                 sep_frame.pack(fill=tk.X, pady=10)
                 ttk.Separator(sep_frame, orient='horizontal').pack(fill=tk.X, padx=50)
         
         # Additional learning tips section
-        tips_container = tk.Frame(content_frame, bg=palette['background_3'])
+        tips_container = tk.Frame(content_frame, bg=palette.background_3)
         tips_container.pack(fill=tk.X, expand=True, pady=25)
         
-        tips_frame = tk.Frame(tips_container, bg=palette['background_3'], bd=2, relief=tk.GROOVE)
+        tips_frame = tk.Frame(tips_container, bg=palette.background_3, bd=2, relief=tk.GROOVE)
         tips_frame.pack(fill=tk.X, expand=True, padx=15)
         
         # Title centered
-        tips_title = tk.Frame(tips_frame, bg=palette['background_3'], padx=10, pady=15)
+        tips_title = tk.Frame(tips_frame, bg=palette.background_3, padx=10, pady=15)
         tips_title.pack(fill=tk.X)
         
         tk.Label(tips_title, text="Learning Tips", font=('Arial', 30, 'bold'), 
-                fg="#bd93f9", bg=palette['background_3']).pack(anchor="center")
+                fg="#bd93f9", bg=palette.background_3).pack(anchor="center")
         
         # Tips with larger touch targets
         tips = [
@@ -1569,54 +1593,54 @@ class LearnHub:
         ]
         
         # Container for tips
-        tips_list = tk.Frame(tips_frame, bg=palette['background_3'], padx=24, pady=18)
+        tips_list = tk.Frame(tips_frame, bg=palette.background_3, padx=24, pady=18)
         tips_list.pack(fill=tk.X)
         
         for tip in tips:
-            tip_container = tk.Frame(tips_list, bg=palette['background_3'], pady=12)
+            tip_container = tk.Frame(tips_list, bg=palette.background_3, pady=12)
             tip_container.pack(fill=tk.X)
             
             # Create a frame to center the tip content
-            tip_content = tk.Frame(tip_container, bg=palette['background_3'])
+            tip_content = tk.Frame(tip_container, bg=palette.background_3)
             tip_content.pack(anchor="center")
             
             # Bullet point and tip text with larger font and padding for touch
             tk.Label(tip_content, text="•", font=('Arial', 24, 'bold'), 
-                    fg=palette['description_label_color'], bg=palette['background_3']).pack(side=tk.LEFT, padx=(0, 16))
+                    fg=palette.description_label_color, bg=palette.background_3).pack(side=tk.LEFT, padx=(0, 16))
             
             tk.Label(tip_content, text=tip, font=('Arial', 20), 
-                    fg=palette['description_label_color'], bg=palette['background_3'], 
+                    fg=palette.description_label_color, bg=palette.background_3, 
                     wraplength=900, justify=tk.LEFT).pack(side=tk.LEFT, padx=8, pady=8)
 
 
     def create_enhanced_resource_card_horizontal(self, parent, title, url, description, icon, rating):
         """Create enhanced resource cards with horizontal layout and hover effects"""
-        card_frame = tk.Frame(parent, bg=palette['background_3'], relief=tk.FLAT, bd=0, width=250, height=300)
+        card_frame = tk.Frame(parent, bg=palette.background_3, relief=tk.FLAT, bd=0, width=250, height=300)
         card_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=8)
         card_frame.pack_propagate(False)  # Maintain fixed size
 
         # Glow frame
-        glow_frame = tk.Frame(card_frame, bg=palette['glow_frame_color'], height=2)
+        glow_frame = tk.Frame(card_frame, bg=palette.glow_frame_color, height=2)
         glow_frame.pack(fill=tk.X)
         glow_frame.pack_forget()
 
         # Content frame
-        content_frame = tk.Frame(card_frame, bg=palette['background_3'])
+        content_frame = tk.Frame(card_frame, bg=palette.background_3)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
 
         # Header with icon
-        header_frame = tk.Frame(content_frame, bg=palette['background_3'])
+        header_frame = tk.Frame(content_frame, bg=palette.background_3)
         header_frame.pack(fill=tk.X, pady=(0, 10))
 
         # Icon - centered and larger
         icon_label = tk.Label(header_frame, text=icon,
-                            font=('Arial', 28), bg=palette['background_3'])
+                            font=('Arial', 28), bg=palette.background_3)
         icon_label.pack()
 
         # Title - centered with wrapping
         title_label = tk.Label(header_frame, text=title,
                             font=('Arial', 12, 'bold'),
-                            fg=palette['enhanced_title_color'], bg=palette['background_3'],
+                            fg=palette.enhanced_title_color, bg=palette.background_3,
                             cursor='hand2', wraplength=220, justify=tk.CENTER)
         title_label.pack(pady=(5, 0))
         title_label.bind("<Button-1>", lambda e: self.open_url(url))
@@ -1625,13 +1649,13 @@ class LearnHub:
         stars = "" * rating + "" * (5 - rating)
         rating_label = tk.Label(header_frame, text=stars,
                             font=('Arial', 10),
-                            fg=palette['rating_label_color'], bg=palette['background_3'])
+                            fg=palette.rating_label_color, bg=palette.background_3)
         rating_label.pack(pady=(5, 0))
 
         # Description - centered with wrapping
         desc_label = tk.Label(content_frame, text=description,
                             font=('Arial', 10),
-                            fg=palette['enhanced_description_color'], bg=palette['background_3'],
+                            fg=palette.enhanced_description_color, bg=palette.background_3,
                             wraplength=220, justify=tk.CENTER)
         desc_label.pack(pady=(10, 15))
 
@@ -1640,20 +1664,20 @@ class LearnHub:
         try_canvas.pack()
 
         # Draw try button
-        try_canvas.create_rectangle(0, 0, 100, 35, fill=palette['try_it_button_background'], outline=palette['try_it_button_background'], tags="bg")
+        try_canvas.create_rectangle(0, 0, 100, 35, fill=palette.try_it_button_background, outline=palette.try_it_button_background, tags="bg")
         try_canvas.create_text(50, 17, text="Try It →",
                              font=('Arial', 10, 'bold'),
-                             fill=palette['background_black'], tags="text")
+                             fill=palette.background_black, tags="text")
 
         def on_try_click(event):
             self.open_url(url)
 
         def on_try_enter(event):
-            try_canvas.itemconfig("bg", fill=palette['close_button_hover_background'])
+            try_canvas.itemconfig("bg", fill=palette.close_button_hover_background)
             try_canvas.configure(cursor='hand2')
 
         def on_try_leave(event):
-            try_canvas.itemconfig("bg", fill=palette['try_it_button_background'])
+            try_canvas.itemconfig("bg", fill=palette.try_it_button_background)
             try_canvas.configure(cursor='')
 
         try_canvas.bind("<Button-1>", on_try_click)
@@ -1662,19 +1686,19 @@ class LearnHub:
 
         # Hover effects
         def on_enter(event):
-            card_frame.configure(bg=palette['background_4'])
-            content_frame.configure(bg=palette['background_4'])
-            header_frame.configure(bg=palette['background_4'])
+            card_frame.configure(bg=palette.background_4)
+            content_frame.configure(bg=palette.background_4)
+            header_frame.configure(bg=palette.background_4)
             for widget in [icon_label, title_label, rating_label, desc_label]:
-                widget.configure(bg=palette['background_4'])
+                widget.configure(bg=palette.background_4)
             glow_frame.pack(fill=tk.X, before=content_frame)
 
         def on_leave(event):
-            card_frame.configure(bg=palette['background_3'])
-            content_frame.configure(bg=palette['background_3'])
-            header_frame.configure(bg=palette['background_3'])
+            card_frame.configure(bg=palette.background_3)
+            content_frame.configure(bg=palette.background_3)
+            header_frame.configure(bg=palette.background_3)
             for widget in [icon_label, title_label, rating_label, desc_label]:
-                widget.configure(bg=palette['background_3'])
+                widget.configure(bg=palette.background_3)
             glow_frame.pack_forget()
 
         card_frame.bind("<Enter>", on_enter)
@@ -1688,11 +1712,11 @@ class LearnHub:
 
     def create_separator_horizontal(self, parent):
         """Create a horizontal separator for horizontal layout"""
-        separator_frame = tk.Frame(parent, bg=palette['background_3'])  # Changed from #1a1a1a to #2a2a2a
+        separator_frame = tk.Frame(parent, bg=palette.background_3)  # Changed from #1a1a1a to #2a2a2a
         separator_frame.pack(fill=tk.X, pady=30)
 
         # Gradient-like separator
-        colors = [palette['gradient_separator_1'], palette['gradient_separator_2'], palette['gradient_separator_3']]
+        colors = [palette.gradient_separator_1, palette.gradient_separator_2, palette.gradient_separator_3]
         for i, color in enumerate(colors):
             line = tk.Frame(separator_frame, bg=color, height=2)
             line.pack(fill=tk.X, pady=1)
@@ -1700,13 +1724,13 @@ class LearnHub:
 
     def create_section_header_horizontal(self, parent, title, color):
         """Create an enhanced section header for horizontal layout"""
-        header_frame = tk.Frame(parent, bg=palette['background_3'])  # Changed from #1a1a1a to #2a2a2a
+        header_frame = tk.Frame(parent, bg=palette.background_3)  # Changed from #1a1a1a to #2a2a2a
         header_frame.pack(fill=tk.X, pady=(20, 15))
 
         # Title with underline effect
         title_label = tk.Label(header_frame, text=title,
                             font=('Arial', 18, 'bold'),
-                            fg=color, bg=palette['background_3'])  # Changed from #1a1a1a to #2a2a2a
+                            fg=color, bg=palette.background_3)  # Changed from #1a1a1a to #2a2a2a
         title_label.pack()
 
         # Underline
@@ -1716,13 +1740,13 @@ class LearnHub:
 
     def create_section_header(self, parent, title, color):
         """Create an enhanced section header"""
-        header_frame = tk.Frame(parent, bg=palette['background'])
+        header_frame = tk.Frame(parent, bg=palette.background)
         header_frame.pack(fill=tk.X, pady=(20, 15))
 
         # Title with underline effect
         title_label = tk.Label(header_frame, text=title,
                               font=('Arial', 18, 'bold'),
-                              fg=color, bg=palette['background'])
+                              fg=color, bg=palette.background)
         title_label.pack(anchor=tk.W)
 
         # Underline
@@ -1732,34 +1756,34 @@ class LearnHub:
 
     def create_enhanced_resource_card(self, parent, title, url, description, icon, rating):
         """Create enhanced resource cards with ratings and hover effects"""
-        card_frame = tk.Frame(parent, bg=palette['background_3'], relief=tk.FLAT, bd=0)
+        card_frame = tk.Frame(parent, bg=palette.background_3, relief=tk.FLAT, bd=0)
         card_frame.pack(fill=tk.X, pady=8)
 
         # Glow frame
-        glow_frame = tk.Frame(card_frame, bg=palette['glow_frame_color'], height=2)
+        glow_frame = tk.Frame(card_frame, bg=palette.glow_frame_color, height=2)
         glow_frame.pack(fill=tk.X)
         glow_frame.pack_forget()
 
         # Content frame
-        content_frame = tk.Frame(card_frame, bg=palette['background_3'])
+        content_frame = tk.Frame(card_frame, bg=palette.background_3)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
 
         # Header
-        header_frame = tk.Frame(content_frame, bg=palette['background_3'])
+        header_frame = tk.Frame(content_frame, bg=palette.background_3)
         header_frame.pack(fill=tk.X, pady=(0, 8))
 
         # Icon
         icon_label = tk.Label(header_frame, text=icon,
-                             font=('Arial', 20), bg=palette['background_3'])
+                             font=('Arial', 20), bg=palette.background_3)
         icon_label.pack(side=tk.LEFT, padx=(0, 15))
 
         # Title and rating
-        title_frame = tk.Frame(header_frame, bg=palette['background_3'])
+        title_frame = tk.Frame(header_frame, bg=palette.background_3)
         title_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         title_label = tk.Label(title_frame, text=title,
                               font=('Arial', 14, 'bold'),
-                              fg=palette['enhanced_title_color'], bg=palette['background_3'],
+                              fg=palette.enhanced_title_color, bg=palette.background_3,
                               cursor='hand2')
         title_label.pack(anchor=tk.W)
         title_label.bind("<Button-1>", lambda e: self.open_url(url))
@@ -1768,7 +1792,7 @@ class LearnHub:
         stars = "" * rating + "" * (5 - rating)
         rating_label = tk.Label(title_frame, text=f"Rating: {stars}",
                                font=('Arial', 10),
-                               fg=palette['rating_label_color'], bg=palette['background_3'])
+                               fg=palette.rating_label_color, bg=palette.background_3)
         rating_label.pack(anchor=tk.W)
 
         # Try it button
@@ -1776,20 +1800,20 @@ class LearnHub:
         try_canvas2.pack(side=tk.RIGHT)
 
         # Draw try button
-        try_canvas2.create_rectangle(0, 0, 80, 30, fill=palette['try_it_button_background'], outline=palette['try_it_button_background'], tags="bg")
+        try_canvas2.create_rectangle(0, 0, 80, 30, fill=palette.try_it_button_background, outline=palette.try_it_button_background, tags="bg")
         try_canvas2.create_text(40, 15, text="Try It →",
                               font=('Arial', 10, 'bold'),
-                              fill=palette['background_black'], tags="text")
+                              fill=palette.background_black, tags="text")
 
         def on_try2_click(event):
             self.open_url(url)
 
         def on_try2_enter(event):
-            try_canvas2.itemconfig("bg", fill=palette['close_button_hover_background'])
+            try_canvas2.itemconfig("bg", fill=palette.close_button_hover_background)
             try_canvas2.configure(cursor='hand2')
 
         def on_try2_leave(event):
-            try_canvas2.itemconfig("bg", fill=palette['try_it_button_background'])
+            try_canvas2.itemconfig("bg", fill=palette.try_it_button_background)
             try_canvas2.configure(cursor='')
 
         try_canvas2.bind("<Button-1>", on_try2_click)
@@ -1799,26 +1823,26 @@ class LearnHub:
         # Description
         desc_label = tk.Label(content_frame, text=description,
                              font=('Arial', 11),
-                             fg=palette['enhanced_description_color'], bg=palette['background_3'])
+                             fg=palette.enhanced_description_color, bg=palette.background_3)
         desc_label.pack(anchor=tk.W)
 
         # Hover effects
         def on_enter(event):
-            card_frame.configure(bg=palette['background_4'])
-            content_frame.configure(bg=palette['background_4'])
-            header_frame.configure(bg=palette['background_4'])
-            title_frame.configure(bg=palette['background_4'])
+            card_frame.configure(bg=palette.background_4)
+            content_frame.configure(bg=palette.background_4)
+            header_frame.configure(bg=palette.background_4)
+            title_frame.configure(bg=palette.background_4)
             for widget in [icon_label, title_label, rating_label, desc_label]:
-                widget.configure(bg=palette['background_4'])
+                widget.configure(bg=palette.background_4)
             glow_frame.pack(fill=tk.X, before=content_frame)
 
         def on_leave(event):
-            card_frame.configure(bg=palette['background_3'])
-            content_frame.configure(bg=palette['background_3'])
-            header_frame.configure(bg=palette['background_3'])
-            title_frame.configure(bg=palette['background_3'])
+            card_frame.configure(bg=palette.background_3)
+            content_frame.configure(bg=palette.background_3)
+            header_frame.configure(bg=palette.background_3)
+            title_frame.configure(bg=palette.background_3)
             for widget in [icon_label, title_label, rating_label, desc_label]:
-                widget.configure(bg=palette['background_3'])
+                widget.configure(bg=palette.background_3)
             glow_frame.pack_forget()
 
         card_frame.bind("<Enter>", on_enter)
@@ -1827,11 +1851,11 @@ class LearnHub:
 
     def create_separator(self, parent):
         """Create an animated separator"""
-        separator_frame = tk.Frame(parent, bg=palette['background'])
+        separator_frame = tk.Frame(parent, bg=palette.background)
         separator_frame.pack(fill=tk.X, pady=25)
 
         # Gradient-like separator
-        colors = [palette['gradient_separator_1'], palette['gradient_separator_2'], palette['gradient_separator_3']]
+        colors = [palette.gradient_separator_1, palette.gradient_separator_2, palette.gradient_separator_3]
         for i, color in enumerate(colors):
             line = tk.Frame(separator_frame, bg=color, height=1)
             line.pack(fill=tk.X, pady=1)
@@ -1884,6 +1908,8 @@ class LearnHub:
     def open_url(self, url):
         """Open URL in default browser"""
         try:
+            # Imported on demand; webbrowser pulls in subprocess/shlex at import
+            import webbrowser
             webbrowser.open(url)
         except Exception as e:
             print(f"Error opening URL: {e}")
@@ -1951,7 +1977,7 @@ class LearnHub:
         menu_root = tk.Tk()
         menu_root.title("Infinity Qubit - Main Menu")
         menu_root.geometry("400x300")
-        menu_root.configure(bg=palette['background'])
+        menu_root.configure(bg=palette.background)
 
         # Center the window
         menu_root.update_idletasks()
@@ -1962,36 +1988,36 @@ class LearnHub:
         # Title
         title_label = tk.Label(menu_root, text=" Infinity Qubit",
                             font=('Arial', 24, 'bold'),
-                            fg=palette['title_color'], bg=palette['background'])
+                            fg=palette.title_color, bg=palette.background)
         title_label.pack(pady=30)
 
         # Subtitle
         subtitle_label = tk.Label(menu_root, text="Main Menu",
                                 font=('Arial', 16),
-                                fg=palette['subtitle_color'], bg=palette['background'])
+                                fg=palette.subtitle_color, bg=palette.background)
         subtitle_label.pack(pady=10)
 
         # Menu options
-        button_frame = tk.Frame(menu_root, bg=palette['background'])
+        button_frame = tk.Frame(menu_root, bg=palette.background)
         button_frame.pack(expand=True)
 
         # Learn Hub button
         # Learn button using canvas for macOS compatibility
         self.create_canvas_dialog_button(button_frame, " Learn Hub",
                                         lambda event=None: self.reopen_learn_hub(menu_root),
-                                        200, 45, palette['learn_button_background'],
-                                        palette['background_black'], pady=5)
+                                        200, 45, palette.learn_button_background,
+                                        palette.background_black, pady=5)
 
         # Placeholder for other modes
         placeholder_label = tk.Label(button_frame, text="Other game modes coming soon...",
                                     font=('Arial', 10, 'italic'),
-                                    fg=palette['placeholder_text_color'], bg=palette['background'])
+                                    fg=palette.placeholder_text_color, bg=palette.background)
         placeholder_label.pack(pady=20)
 
         # Close button using canvas for macOS compatibility
         self.create_canvas_dialog_button(button_frame, " Exit", menu_root.destroy,
-                                        200, 45, palette['close_button_background'],
-                                        palette['close_button_text_color'], pady=5)
+                                        200, 45, palette.close_button_background,
+                                        palette.close_button_text_color, pady=5)
 
         menu_root.mainloop()
 
@@ -9,22 +9,56 @@ import os
 import tkinter as tk
 import json
 import warnings
+from collections import namedtuple
+from functools import lru_cache
 
 # Suppress pygame welcome message
 warnings.filterwarnings("ignore", category=UserWarning, module="pygame.pkgdata")
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 
 import pygame
+import numpy as np
 from tkinter import messagebox
 
-from q_utils import get_colors_from_file, extract_color_palette
+from q_utils import get_stage_colors, init_mixer, load_json_file, dump_json_file
 
 sys.path.append('..')
 from run import PROJECT_ROOT, get_resource_path
 
-# Get color palette
-color_file_path = get_resource_path('config/color_palette.json')
-palette = extract_color_palette(get_colors_from_file(color_file_path), 'puzzle_level_selection')
+# Button colors used by the drawing callbacks
+ButtonColors = namedtuple('ButtonColors', ['level_bg', 'level_hover', 'level_text', 'locked_bg',
+                                           'nav_bg', 'nav_hover', 'nav_text'])
+
+
+@lru_cache(maxsize=None)
+def get_palette():
+    """Load the color palette on first use rather than at import time"""
+    color_file_path = get_resource_path('config/color_palette.json')
+    return get_stage_colors(color_file_path, 'puzzle_level_selection')
+
+
+@lru_cache(maxsize=None)
+def get_button_colors():
+    """Resolve the button colors once for the drawing callbacks"""
+    palette = get_palette()
+    return ButtonColors(
+        level_bg=palette.get('level_button_color', '#ffb86b'),
+        level_hover=palette.get('level_button_hover_color', '#ffd08f'),
+        level_text=palette.get('level_button_text_color', '#2c1f12'),
+        locked_bg=palette.get('locked_level_color', '#666666'),
+        nav_bg=palette.get('puzzle_mode_button_color', '#4CAF50'),
+        nav_hover=palette.get('puzzle_mode_button_hover_color', '#45a049'),
+        nav_text=palette.get('puzzle_mode_button_text_color', 'white'))
+
+# Resolved drawing state for a single level button
+LevelStyle = namedtuple('LevelStyle', ['bg', 'text', 'border', 'unlocked'])
+
+# Sound effects used by the level selection screen
+SOUND_FILES = {
+    'click': get_resource_path('resources/sounds/click.wav'),
+    'success': get_resource_path('resources/sounds/correct.wav'),
+    'locked': get_resource_path('resources/sounds/error.wav')
+}
 
 
 class PuzzleLevelSelection:
@@ -40,28 +74,15 @@ class PuzzleLevelSelection:
         self.root.title("Infinity Qubit - Level Selection")
 
         # Set fullscreen mode
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-
-        # Make window fullscreen without title bar
-        self.root.overrideredirect(True)
-        self.root.geometry(f"{screen_width}x{screen_height}+0+0")
-        self.root.configure(bg=palette['background'])
-
-        # Store dimensions
-        self.window_width = screen_width
-        self.window_height = screen_height
+        self._configure_window()
 
         # Bind keys
         self.root.bind('<Escape>', self.return_to_game_mode_selection)
         self.root.bind('<F11>', self.toggle_fullscreen)
 
-        # Initialize sound system
-        try:
-            pygame.mixer.init()
-            self.sound_enabled = True
-        except:
-            self.sound_enabled = False
+        # Sound system is initialized on first use in play_sound
+        self.sound_enabled = True
+        self._mixer_ready = False
 
         # Load puzzle levels and progress
         self.load_puzzle_levels()
@@ -75,12 +96,26 @@ class PuzzleLevelSelection:
         self.root.focus_force()
 
 
+    def _configure_window(self):
+        """Size the window to fill the screen"""
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+
+        # Make window fullscreen without title bar
+        self.root.overrideredirect(True)
+        self.root.geometry(f"{screen_width}x{screen_height}+0+0")
+        self.root.configure(bg=get_palette()['background'])
+
+        # Store dimensions
+        self.window_width = screen_width
+        self.window_height = screen_height
+
+
     def load_puzzle_levels(self):
         """Load puzzle levels from JSON file"""
         try:
             levels_file = get_resource_path('config/puzzle_levels_temp.json')
-            with open(levels_file, 'r') as f:
-                self.levels = json.load(f)
+            self.levels = load_json_file(levels_file)
         except FileNotFoundError:
             print("❌ puzzle_levels_temp.json not found, using fallback levels")
             self.levels = self.create_fallback_levels()
@@ -114,11 +149,10 @@ class PuzzleLevelSelection:
         """Load player progress from save file"""
         try:
             save_file = get_resource_path('resources/saves/infinity_qubit_puzzle_save.json')
-            with open(save_file, 'r') as f:
-                self.progress = json.load(f)
-                self.max_unlocked_level = self.progress.get('current_level', 0)
-                self.completed_levels = self.progress.get('completed_levels', [])
-                self.level_scores = self.progress.get('level_scores', {})
+            self.progress = load_json_file(save_file)
+            self.max_unlocked_level = self.progress.get('current_level', 0)
+            self.completed_levels = self.progress.get('completed_levels', [])
+            self.level_scores = self.progress.get('level_scores', {})
         except (FileNotFoundError, json.JSONDecodeError):
             # No progress file exists or corrupted, start from beginning
             self.max_unlocked_level = 0  # Only level 1 (index 0) unlocked
@@ -130,6 +164,19 @@ class PuzzleLevelSelection:
                 'level_scores': {}
             }
 
+        self.build_level_styles()
+
+
+    def build_level_styles(self):
+        """Resolve the colors and lock state of every level button once"""
+        colors = get_button_colors()
+        locked_style = LevelStyle(colors.locked_bg, '#999999', '#555555', False)
+        unlocked_style = LevelStyle(colors.level_bg, colors.level_text, colors.level_bg, True)
+
+        # Completed, current and available levels currently share one style
+        self._level_style = [unlocked_style if level_index <= self.max_unlocked_level else locked_style
+                             for level_index in range(len(self.levels))]
+
 
     def save_progress(self):
         """Save current progress to file"""
@@ -137,8 +184,12 @@ class PuzzleLevelSelection:
             save_file = get_resource_path('resources/saves/infinity_qubit_puzzle_save.json')
             os.makedirs(os.path.dirname(save_file), exist_ok=True)
             
-            with open(save_file, 'w') as f:
-                json.dump(self.progress, f, indent=2)
+            dump_json_file(self.progress, save_file)
+
+            # Progress may have unlocked new levels
+            self.max_unlocked_level = self.progress.get('current_level', self.max_unlocked_level)
+            self.completed_levels = self.progress.get('completed_levels', self.completed_levels)
+            self.build_level_styles()
         except Exception as e:
             print(f"Failed to save progress: {e}")
 
@@ -154,41 +205,64 @@ class PuzzleLevelSelection:
         self.play_sound('click')
 
         from game_mode_selection import GameModeSelection
-        new_root = tk.Tk()
-        new_app = GameModeSelection(new_root)
 
-        # Make sure the new window is on top
-        new_root.update()
-        new_root.lift()
-        new_root.focus_force()
+        # Reuse the running Tk root instead of starting a second interpreter
+        self.clear_root()
+        GameModeSelection(self.root)
+
+        # Make sure the window is on top
+        self.root.lift()
+        self.root.focus_force()
 
-        # Close main window
-        self.root.destroy()
 
-        new_root.mainloop()
+    def clear_root(self):
+        """Tear down this screen so the next one can be built on the same root"""
+        if getattr(self, '_grid_pending', None) is not None:
+            self.root.after_cancel(self._grid_pending)
+            self._grid_pending = None
+
+        self.root.unbind('<Escape>')
+        self.root.unbind('<F11>')
+        for widget in self.root.winfo_children():
+            widget.destroy()
 
 
     def play_sound(self, sound_type="click"):
         """Play a sound effect"""
         if not self.sound_enabled:
             return
-        
-        try:
-            sound_files = {
-                'click': get_resource_path('resources/sounds/click.wav'),
-                'success': get_resource_path('resources/sounds/correct.wav'),
-                'locked': get_resource_path('resources/sounds/error.wav')
-            }
-            
-            if sound_type in sound_files:
-                sound = pygame.mixer.Sound(sound_files[sound_type])
+
+        if not self._mixer_ready:
+            try:
+                init_mixer()
+                self._mixer_ready = True
+                self.load_sounds()
+            except pygame.error:
+                self.sound_enabled = False
+                return
+
+        sound = self._sound_cache.get(sound_type)
+        if sound:
+            try:
                 sound.play()
-        except Exception as e:
-            pass  # Fail silently if sound can't be played
+            except Exception as e:
+                pass  # Fail silently if sound can't be played
+
+
+    def load_sounds(self):
+        """Decode all sound effects once so playback does not touch the disk"""
+        self._sound_cache = {}
+        for sound_type, sound_path in SOUND_FILES.items():
+            try:
+                self._sound_cache[sound_type] = pygame.mixer.Sound(sound_path)
+            except Exception as e:
+                print(f"Could not load sound {sound_type}: {e}")
 
 
     def create_level_selection_ui(self):
         """Create the main level selection interface"""
+        palette = get_palette()
+
         # Main container
         main_frame = tk.Frame(self.root, bg=palette['background'])
         main_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
@@ -199,6 +273,8 @@ class PuzzleLevelSelection:
 
     def create_level_grid_section(self, parent):
         """Create the scrollable level grid section"""
+        palette = get_palette()
+
         # Container for the level grid
         grid_container_frame = tk.Frame(parent, bg=palette['background_3'], relief=tk.RAISED, bd=2)
         grid_container_frame.place(relx=0.05, rely=0.05, relwidth=0.9, relheight=0.9)
@@ -224,40 +300,16 @@ class PuzzleLevelSelection:
 
     def create_back_to_main_button(self, parent):
         """Create the back to main menu button"""
-        # Button canvas only - no container
-        btn_canvas = tk.Canvas(parent, highlightthickness=0, bd=0,
-                              width=max(50, int(self.window_width * 0.04)),
-                              height=max(50, int(self.window_height * 0.04)),
-                              bg=palette.get('level_button_color', '#ffb86b'))
-        btn_canvas.place(relx=0.95, rely=0.5, anchor='center')
-
-        def draw_button(hover=False):
-            btn_canvas.delete("all")
-            btn_canvas.update_idletasks()
-            width = btn_canvas.winfo_width()
-            height = btn_canvas.winfo_height()
-
-            if width <= 1 or height <= 1:
-                return
+        colors = get_button_colors()
+        width = max(50, int(self.window_width * 0.04))
+        height = max(50, int(self.window_height * 0.04))
 
-            # Colors
-            if hover:
-                bg_color = palette.get('level_button_hover_color', '#ffd08f')
-                text_color = palette.get('level_button_text_color', '#2c1f12')
-            else:
-                bg_color = palette.get('level_button_color', '#ffb86b')
-                text_color = palette.get('level_button_text_color', '#2c1f12')
-
-            # Draw button background
-            btn_canvas.create_rectangle(0, 0, width, height,
-                                      fill=bg_color, outline=bg_color, tags="bg")
-
-            # Draw 'X' text
-            font_size = max(16, int(min(width, height) * 0.4))
-            btn_canvas.create_text(width//2, height//2,
-                                 text="X",
-                                 font=('Arial', font_size, 'bold'),
-                                 fill=text_color, tags="text")
+        # A Label keeps its colors on every platform and needs no redraw on hover
+        btn_label = tk.Label(parent, text="X",
+                             font=('Arial', max(16, int(min(width, height) * 0.4)), 'bold'),
+                             fg=colors.level_text, bg=colors.level_bg, cursor='hand2',
+                             bd=0, highlightthickness=0)
+        btn_label.place(relx=0.95, rely=0.5, anchor='center', width=width, height=height)
 
         # Event handlers
         def on_click(event):
@@ -265,172 +317,198 @@ class PuzzleLevelSelection:
             self.return_to_game_mode_selection()
 
         def on_enter(event):
-            draw_button(hover=True)
-            btn_canvas.configure(cursor='hand2')
+            btn_label.configure(bg=colors.level_hover)
 
         def on_leave(event):
-            draw_button(hover=False)
-            btn_canvas.configure(cursor='')
+            btn_label.configure(bg=colors.level_bg)
 
         # Bind events
-        btn_canvas.bind("<Button-1>", on_click)
-        btn_canvas.bind("<Enter>", on_enter)
-        btn_canvas.bind("<Leave>", on_leave)
-
-        # Initial draw
-        btn_canvas.bind('<Configure>', lambda e: draw_button(False))
-        btn_canvas.after(10, lambda: draw_button(False))
+        btn_label.bind("<Button-1>", on_click)
+        btn_label.bind("<Enter>", on_enter)
+        btn_label.bind("<Leave>", on_leave)
 
-        return btn_canvas
+        return btn_label
 
 
     def create_level_grid(self, parent):
-        """Create the responsive grid of level buttons"""
-        # Grid container (adjusted to start below the header)
-        grid_frame = tk.Frame(parent, bg=palette['background_3'])
-        grid_frame.place(relx=0.05, rely=0.15, relwidth=0.9, relheight=0.8)
+        """Create the responsive grid of level buttons on a single canvas"""
+        palette = get_palette()
+
+        # Grid canvas (adjusted to start below the header)
+        self.grid_canvas = tk.Canvas(parent, bg=palette['background_3'],
+                                     highlightthickness=0, bd=0)
+        self.grid_canvas.place(relx=0.05, rely=0.15, relwidth=0.9, relheight=0.8)
 
         # Calculate grid dimensions (6x5 for 30 levels)
-        cols = 6
-        rows = 5
-        
-        # Calculate responsive button dimensions
-        button_rel_width = 0.85 / cols  # 85% of width divided by columns
-        button_rel_height = 0.85 / rows  # 85% of height divided by rows
-        
-        # Create level buttons
-        for level_index in range(len(self.levels)):
-            if level_index >= 30:  # Safety check
-                break
-                
-            row = level_index // cols
-            col = level_index % cols
-            
-            # Calculate relative position
-            rel_x = (col * (1.0 / cols)) + (1.0 / cols) * 0.5
-            rel_y = (row * (1.0 / rows)) + (1.0 / rows) * 0.5
-            
-            self.create_level_button(grid_frame, level_index, rel_x, rel_y, 
-                                   button_rel_width, button_rel_height)
+        self.grid_cols = 6
+        self.grid_rows = 5
+
+        # Create the items of every level button; they are positioned on <Configure>
+        self.level_items = []
+        for level_index in range(min(len(self.levels), 30)):  # Safety check
+            self.draw_level_into(self.grid_canvas, level_index)
+
+        # Grid position of every button, used to lay them all out in one pass
+        level_indices = np.arange(len(self.level_items))
+        self._grid_cols_idx = level_indices % self.grid_cols
+        self._grid_rows_idx = level_indices // self.grid_cols
+
+        # Bursts of <Configure> events collapse into a single idle layout pass
+        self._grid_size = None
+        self._grid_next_size = None
+        self._grid_pending = None
+
+        def layout_when_idle():
+            self._grid_pending = None
+            self.layout_level_grid(*self._grid_next_size)
+
+        def on_configure(event):
+            self._grid_next_size = (event.width, event.height)
+            if self._grid_pending is None:
+                self._grid_pending = self.grid_canvas.after_idle(layout_when_idle)
+
+        self.grid_canvas.bind('<Configure>', on_configure)
+
+        # A single set of mouse bindings dispatches to levels by grid position
+        self._btn_bboxes = []
+        self._cell_size = None
+        self._hover_level = None
+        self.grid_canvas.bind('<Motion>', self.on_grid_motion)
+        self.grid_canvas.bind('<Leave>', self.on_grid_leave)
+        self.grid_canvas.bind('<Button-1>', self.on_grid_click)
+
+
+    def layout_level_grid(self, width, height):
+        """Position every level button for the current grid canvas size"""
+        # Tk reports a 1x1 canvas before the first real geometry pass
+        if width <= 1 or height <= 1:
+            return
 
+        # Nothing to do if the geometry did not actually change
+        if self._grid_size == (width, height):
+            return
+        self._grid_size = (width, height)
 
-    def create_level_button(self, parent, level_index, rel_x, rel_y, rel_width, rel_height):
-        """Create an individual level button"""
-        level = self.levels[level_index]
-        is_unlocked = level_index <= self.max_unlocked_level
-        is_completed = level_index in self.completed_levels
-        is_current = level_index == self.max_unlocked_level
-        
-        # Button container
-        btn_container = tk.Frame(parent, bg=palette['background_4'], relief=tk.RAISED, bd=2)
-        btn_container.place(relx=rel_x, rely=rel_y, relwidth=rel_width * 0.9, 
-                           relheight=rel_height * 0.9, anchor='center')
-
-        # Create canvas for custom drawing
-        btn_canvas = tk.Canvas(btn_container, highlightthickness=0, bd=0)
-        btn_canvas.place(relx=0.05, rely=0.05, relwidth=0.9, relheight=0.9)
-
-        # Draw button content
-        def draw_button():
-            btn_canvas.delete("all")
-            btn_canvas.update_idletasks()
-            width = btn_canvas.winfo_width()
-            height = btn_canvas.winfo_height()
-            
-            if width <= 1 or height <= 1:
-                return
+        cell_width = width / self.grid_cols
+        cell_height = height / self.grid_rows
+        self._cell_size = (cell_width, cell_height)
 
-            # Determine button colors based on state
-            if not is_unlocked:
-                bg_color = palette.get('locked_level_color', '#666666')
-                text_color = '#999999'
-                border_color = '#555555'
-            elif is_completed:
-                bg_color = palette.get('level_button_color', '#ffb86b')
-                text_color = palette.get('level_button_text_color', '#2c1f12')
-                border_color = bg_color
-            elif is_current:
-                bg_color = palette.get('level_button_color', '#ffb86b')
-                text_color = palette.get('level_button_text_color', '#2c1f12')
-                border_color = bg_color
-            else:
-                # Available but not completed - use uniform color
-                bg_color = palette.get('level_button_color', '#ffb86b')
-                text_color = palette.get('level_button_text_color', '#2c1f12')
-                border_color = bg_color
-
-            # Draw button background
-            btn_canvas.create_rectangle(2, 2, width-2, height-2,
-                                      fill=bg_color, outline=border_color, width=2, tags="bg")
-
-            # Level number
-            level_num = level_index + 1
-            level_font_size = max(14, int(min(width, height) * 0.25))
-            btn_canvas.create_text(width//2, height//4, 
-                                 text=f"Level {level_num}",
-                                 font=('Arial', level_font_size, 'bold'),
-                                 fill=text_color, tags="text")
-
-            # Level name (wrapped)
-            name = level['name']
-            name_font_size = max(10, int(min(width, height) * 0.12))
-            
-            # Calculate text wrapping with smaller character limit
-            max_chars_per_line = max(8, min(12, int(width / (name_font_size * 0.7))))  # Smaller chars per line
-            words = name.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                test_line = current_line + (" " if current_line else "") + word
-                if len(test_line) <= max_chars_per_line:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = word
-                    else:
-                        # Single word is too long, truncate it
-                        lines.append(word[:max_chars_per_line-3] + "...")
-                        current_line = ""
-            
-            if current_line:
-                lines.append(current_line)
-            
-            # Limit to 3 lines max
-            if len(lines) > 3:
-                lines = lines[:1] + [lines[1][:max_chars_per_line-3] + "..."]
-            
-            # Draw wrapped text
-            line_height = name_font_size + 2
-            total_height = len(lines) * line_height
-            start_y = height//2 - total_height//2 + line_height
-            
-            for i, line in enumerate(lines):
-                y_pos = start_y + i * line_height
-                btn_canvas.create_text(width//2, y_pos,
-                                     text=line,
-                                     font=('Arial', name_font_size),
-                                     fill=text_color, tags="text")
-
-        # Bind drawing to canvas configuration
-        btn_canvas.bind('<Configure>', lambda e: draw_button())
-        btn_canvas.after(10, draw_button)
-
-        # Click handler
-        if is_unlocked:
-            def on_click(event):
-                self.select_level(level_index)
-            
-            def on_enter(event):
-                btn_canvas.itemconfig("bg", fill=palette.get('level_button_hover_color', '#ffd08f'))
-            
-            def on_leave(event):
-                draw_button()
-            
-            btn_canvas.bind("<Button-1>", on_click)
-            btn_canvas.bind("<Enter>", on_enter)
-            btn_canvas.bind("<Leave>", on_leave)
+        # Buttons take 90% of 85% of their cell, centered in it
+        half_width = cell_width * 0.85 * 0.9 / 2
+        half_height = cell_height * 0.85 * 0.9 / 2
+
+        center_x = (self._grid_cols_idx + 0.5) * cell_width
+        center_y = (self._grid_rows_idx + 0.5) * cell_height
+        self._btn_bboxes = np.column_stack((center_x - half_width, center_y - half_height,
+                                            center_x + half_width, center_y + half_height)).tolist()
+
+        for level_index, bbox in enumerate(self._btn_bboxes):
+            self.layout_level_button(level_index, *bbox)
+
+
+    def level_at(self, x, y):
+        """Return the index of the unlocked level button under (x, y), or None"""
+        if self._cell_size is None:
+            return None
+
+        cell_width, cell_height = self._cell_size
+        col = int(x // cell_width)
+        row = int(y // cell_height)
+        if not (0 <= col < self.grid_cols and 0 <= row < self.grid_rows):
+            return None
+
+        level_index = row * self.grid_cols + col
+        if level_index >= len(self._btn_bboxes) or not self._level_style[level_index].unlocked:
+            return None
+
+        # Ignore the gaps between buttons
+        x0, y0, x1, y1 = self._btn_bboxes[level_index]
+        if x0 <= x <= x1 and y0 <= y <= y1:
+            return level_index
+        return None
+
+
+    def set_hover_level(self, level_index):
+        """Move the hover highlight to the given level (or clear it with None)"""
+        colors = get_button_colors()
+        if level_index == self._hover_level:
+            return
+
+        canvas = self.grid_canvas
+        if self._hover_level is not None:
+            canvas.itemconfigure(f"bg&&lvl{self._hover_level}",
+                                 fill=self._level_style[self._hover_level].bg)
+        if level_index is not None:
+            canvas.itemconfigure(f"bg&&lvl{level_index}", fill=colors.level_hover)
+        self._hover_level = level_index
+
+
+    def on_grid_motion(self, event):
+        """Update the hovered level button"""
+        self.set_hover_level(self.level_at(event.x, event.y))
+
+
+    def on_grid_leave(self, event):
+        """Clear the hover highlight when the pointer leaves the grid"""
+        self.set_hover_level(None)
+
+
+    def on_grid_click(self, event):
+        """Open the clicked level if it is unlocked"""
+        level_index = self.level_at(event.x, event.y)
+        if level_index is not None:
+            self.select_level(level_index)
+
+
+    def draw_level_into(self, canvas, level_index):
+        """Create the canvas items of an individual level button"""
+        palette = get_palette()
+        style = self._level_style[level_index]
+        level_tag = f"lvl{level_index}"
+
+        # Button frame and background
+        frame_id = canvas.create_rectangle(0, 0, 0, 0, fill=palette['background_4'],
+                                           outline=palette['background_4'], width=2,
+                                           tags=("frame", level_tag))
+        bg_id = canvas.create_rectangle(0, 0, 0, 0, fill=style.bg, outline=style.border,
+                                        width=2, tags=("bg", level_tag))
+
+        # Level number
+        title_id = canvas.create_text(0, 0, text=f"Level {level_index + 1}",
+                                      fill=style.text, tags=("text", level_tag))
+
+        # Level name, wrapped natively by Tk to the button width on layout
+        name_id = canvas.create_text(0, 0, text=self.levels[level_index]['name'],
+                                     fill=style.text, justify=tk.CENTER, anchor='center',
+                                     tags=("text", "name", level_tag))
+
+        self.level_items.append({'frame': frame_id, 'bg': bg_id, 'title': title_id, 'name': name_id})
+
+
+    def layout_level_button(self, level_index, x0, y0, x1, y1):
+        """Move and resize the items of a level button to the given box"""
+        canvas = self.grid_canvas
+        items = self.level_items[level_index]
+        canvas.coords(items['frame'], x0, y0, x1, y1)
+
+        # Inner drawing area is 90% of the frame with a 5% margin on each side
+        frame_width = x1 - x0
+        frame_height = y1 - y0
+        x0 += frame_width * 0.05
+        y0 += frame_height * 0.05
+        width = int(frame_width * 0.9)
+        height = int(frame_height * 0.9)
+
+        canvas.coords(items['bg'], x0 + 2, y0 + 2, x0 + width - 2, y0 + height - 2)
+
+        level_font_size = max(14, int(min(width, height) * 0.25))
+        canvas.coords(items['title'], x0 + width//2, y0 + height//4)
+        canvas.itemconfig(items['title'], font=('Arial', level_font_size, 'bold'))
+
+        # Level name (wrapped)
+        name_font_size = max(10, int(min(width, height) * 0.12))
+        canvas.coords(items['name'], x0 + width//2, y0 + height * 0.6)
+        canvas.itemconfig(items['name'], width=int(width * 0.9), font=('Arial', name_font_size))
 
 
     def show_locked_message(self, level_index):
@@ -447,31 +525,27 @@ class PuzzleLevelSelection:
         self.play_sound('success')
 
         from puzzle_mode import PuzzleMode
-        # Create new window first
-        puzzle_root = tk.Tk()
-        puzzle_app = PuzzleMode(puzzle_root, starting_level=level_index)
 
-        # Make sure the new window is on top
-        puzzle_root.update()
-        puzzle_root.lift()
-        puzzle_root.focus_force()
+        # Reuse the running Tk root instead of starting a second interpreter
+        self.clear_root()
+        PuzzleMode(self.root, starting_level=level_index)
 
-        # Close main window
-        self.root.destroy()
-
-        puzzle_root.mainloop()
+        # Make sure the window is on top
+        self.root.lift()
+        self.root.focus_force()
 
 
     def create_nav_button(self, parent, text, command, relx, rely, anchor='center'):
         """Create a navigation button with consistent styling"""
-        btn_frame = tk.Frame(parent, bg=palette.get('puzzle_mode_button_color', '#4CAF50'), 
+        colors = get_button_colors()
+        btn_frame = tk.Frame(parent, bg=colors.nav_bg, 
                             relief=tk.RAISED, bd=2)
         btn_frame.place(relx=relx, rely=rely, anchor=anchor)
 
         btn_label = tk.Label(btn_frame, text=text,
                             font=('Arial', max(12, int(self.window_width / 120)), 'bold'),
-                            fg=palette.get('puzzle_mode_button_text_color', 'white'),
-                            bg=palette.get('puzzle_mode_button_color', '#4CAF50'),
+                            fg=colors.nav_text,
+                            bg=colors.nav_bg,
                             padx=20, pady=10)
         btn_label.pack()
 
@@ -481,13 +555,13 @@ class PuzzleLevelSelection:
             command()
 
         def on_enter(event):
-            btn_frame.configure(bg=palette.get('puzzle_mode_button_hover_color', '#45a049'))
-            btn_label.configure(bg=palette.get('puzzle_mode_button_hover_color', '#45a049'))
+            btn_frame.configure(bg=colors.nav_hover)
+            btn_label.configure(bg=colors.nav_hover)
             btn_label.configure(cursor='hand2')
 
         def on_leave(event):
-            btn_frame.configure(bg=palette.get('puzzle_mode_button_color', '#4CAF50'))
-            btn_label.configure(bg=palette.get('puzzle_mode_button_color', '#4CAF50'))
+            btn_frame.configure(bg=colors.nav_bg)
+            btn_label.configure(bg=colors.nav_bg)
             btn_label.configure(cursor='')
 
         btn_label.bind("<Button-1>", on_click)
@@ -1,17 +1,69 @@
+import os
 import json
+from functools import lru_cache
 
-# Read object array from color JSON
+# orjson is optional; fall back to the standard library parser when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Mixer settings shared by every screen; the buffer (samples) is overridable per machine
+MIXER_FREQUENCY = 22050
+MIXER_BUFFER = int(os.environ.get('PYGAME_MIXER_BUFFER', 512))
+
+
+# Open the pygame mixer once with the shared settings
+def init_mixer():
+    """Initialize the pygame mixer unless an earlier screen already did"""
+    import pygame
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER)
+
+
+# Read object array from color JSON, parsed once per file for the whole process
+@lru_cache(maxsize=8)
 def get_colors_from_file(file_path):
-    """Read colors from a JSON file and return as an object list"""
-    with open(file_path, 'r') as file:
-        palette_list = json.load(file)
-    return palette_list
-
-
-# Search palette for specific stage
-def extract_color_palette(palette_list, stage_name):
-    """Extract color palette for a specific stage"""
-    for stage in palette_list:
-        if stage['stage_name'] == stage_name:
-            return stage['colors']
-    return None
+    """Read colors from a JSON file and return as an object list (shared, do not modify)"""
+    return load_json_file(file_path)
+
+
+# Stage name -> colors for a color JSON file, built once per file
+@lru_cache(maxsize=8)
+def _get_stage_index(file_path):
+    """Index the stages of a color file by name; the first matching stage wins"""
+    return {stage['stage_name']: stage['colors'] for stage in reversed(get_colors_from_file(file_path))}
+
+
+# Look up a stage's colors straight from a color JSON file
+def get_stage_colors(file_path, stage_name):
+    """Return the color palette for a specific stage of a color file"""
+    return _get_stage_index(file_path).get(stage_name)
+
+
+# Read any JSON file through the fastest available parser
+def load_json_file(file_path):
+    """Read a JSON file and return the parsed object"""
+    with open(file_path, 'rb') as file:
+        data = file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Write any JSON-serializable object atomically with 2-space indentation
+def dump_json_file(obj, file_path):
+    """Serialize an object to a JSON file, replacing it atomically"""
+    tmp_path = f"{file_path}.tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as file:
+            file.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            file.flush()
+            os.fsync(file.fileno())
+    else:
+        with open(tmp_path, 'w') as file:
+            json.dump(obj, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+    # Readers see either the old or the new file, never a half-written one
+    os.replace(tmp_path, file_path)
@@ -23,14 +23,14 @@ from qiskit.quantum_info import Statevector
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from qiskit.visualization import plot_bloch_multivector, plot_state_qsphere
 
-from q_utils import get_colors_from_file, extract_color_palette
+from q_utils import get_stage_colors, init_mixer
 
 sys.path.append('..')
 from run import PROJECT_ROOT, get_resource_path
 
 # Get color palette
 color_file_path = get_resource_path('config/color_palette.json')
-palette = extract_color_palette(get_colors_from_file(color_file_path), 'sandbox_mode')
+palette = get_stage_colors(color_file_path, 'sandbox_mode')
 
 
 class SandboxMode:
@@ -61,8 +61,7 @@ class SandboxMode:
 
         # Initialize sound system (optional - can reuse from main)
         try:
-            if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            init_mixer()
             self.sound_enabled = True
 
             # Load sound files (same as tutorial)
@@ -8,14 +8,14 @@ import sys
 import tkinter as tk
 from tkinter import ttk
 
-from q_utils import get_colors_from_file, extract_color_palette
+from q_utils import get_stage_colors
 
 sys.path.append('..')
 from run import PROJECT_ROOT, get_resource_path
 
 # Get color palette
 color_file_path = get_resource_path('config/color_palette.json')
-palette = extract_color_palette(get_colors_from_file(color_file_path), 'splash_screen')
+palette = get_stage_colors(color_file_path, 'splash_screen')
 
 
 class SplashScreen:
@@ -18,14 +18,14 @@ from qiskit_aer import Aer
 from qiskit import QuantumCircuit
 from qiskit.quantum_info import Statevector
 
-from q_utils import get_colors_from_file, extract_color_palette
+from q_utils import get_stage_colors, init_mixer
 
 sys.path.append('..')
 from run import PROJECT_ROOT, get_resource_path
 
 # Get color palette
 color_file_path = get_resource_path('config/color_palette.json')
-palette = extract_color_palette(get_colors_from_file(color_file_path), 'tutorial_mode')
+palette = get_stage_colors(color_file_path, 'tutorial_mode')
 
 
 class TutorialWindow:
@@ -1260,7 +1260,7 @@ class TutorialWindow:
         """Initialize the sound system (same as puzzle_mode)"""
         try:
             # Initialize pygame mixer
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            init_mixer()
             self.sound_enabled = True
             self.load_sounds()
         except pygame.error:
@@ -1680,7 +1680,7 @@ class GateTutorial:
                 return
 
             # Initialize pygame mixer
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            init_mixer()
             self.sound_enabled = True
             self.load_sounds()
         except pygame.error: